@@ -36,14 +36,31 @@ import json
 import re
 import sys
 
-
-def check_command(command: str) -> list[dict]:
-    """Check command for expensive patterns. Returns list of {level, message}."""
+# All patterns fused into one alternation so the command is scanned once.
+# Only "opus" is case-insensitive, matching the original per-pattern flags.
+# A trailing "&" is checked with str methods rather than an anchored regex.
+_COMBINED = re.compile(
+    r'(?P<run_loop>run_loop)'
+    r'|(?P<run_eval>run_eval)'
+    r'|(?P<opus>(?i:opus))'
+    r'|(?P<claude_p>claude\s+-p)'
+    r'|(?P<batch_ctx>run_in_background|\bfor\b|\bwhile\b|\bxargs\b|\bparallel\b)'
+    r'|(?P<anthropic>anthropic\.Anthropic|client\.messages\.create)'
+)
+
+
+def check_command(command: str) -> tuple[list[dict], bool]:
+    """Check command for expensive patterns. Returns ([{level, message}], has_block)."""
     issues = []
+    has_block = False
+
+    hits = {}
+    for m in _COMBINED.finditer(command):
+        hits[m.lastgroup] = hits.get(m.lastgroup, 0) + 1
 
     # --- BLOCK: Opus in batch/eval operations ---
     # run_loop.py or run_eval.py with opus model
-    if re.search(r'run_(loop|eval)', command) and re.search(r'opus', command, re.IGNORECASE):
+    if (hits.get("run_loop") or hits.get("run_eval")) and hits.get("opus"):
         issues.append({
             "level": "block",
             "message": (
@@ -52,10 +69,11 @@ def check_command(command: str) -> list[dict]:
                 "Use --model claude-haiku-4-5-20251001 instead."
             ),
         })
+        has_block = True
 
     # --- BLOCK: claude -p with opus in background ---
-    if re.search(r'claude\s+-p', command) and re.search(r'opus', command, re.IGNORECASE):
-        if re.search(r'run_in_background|&\s*$|\bfor\b|\bwhile\b|\bxargs\b|\bparallel\b', command):
+    if hits.get("claude_p") and hits.get("opus"):
+        if hits.get("batch_ctx") or command.rstrip().endswith("&"):
             issues.append({
                 "level": "block",
                 "message": (
@@ -63,9 +81,10 @@ def check_command(command: str) -> list[dict]:
                     "Use Haiku or Sonnet for batch operations."
                 ),
             })
+            has_block = True
 
     # --- WARN: Any run_loop.py execution ---
-    if re.search(r'run_loop', command) and not any(i["level"] == "block" for i in issues):
+    if hits.get("run_loop") and not has_block:
         issues.append({
             "level": "warn",
             "message": (
@@ -77,7 +96,7 @@ def check_command(command: str) -> list[dict]:
         })
 
     # --- WARN: Multiple claude -p in a single command ---
-    claude_p_count = len(re.findall(r'claude\s+-p', command))
+    claude_p_count = hits.get("claude_p", 0)
     if claude_p_count > 1:
         issues.append({
             "level": "warn",
@@ -88,7 +107,7 @@ def check_command(command: str) -> list[dict]:
         })
 
     # --- WARN: Batch API calls without key check ---
-    if re.search(r'anthropic\.Anthropic|client\.messages\.create', command):
+    if hits.get("anthropic"):
         issues.append({
             "level": "warn",
             "message": (
@@ -97,7 +116,7 @@ def check_command(command: str) -> list[dict]:
             ),
         })
 
-    return issues
+    return issues, has_block
 
 
 def main():
@@ -117,17 +136,14 @@ def main():
     if not command:
         sys.exit(0)
 
-    issues = check_command(command)
+    issues, has_block = check_command(command)
 
     if not issues:
         sys.exit(0)
 
-    # If any issue is a block, block the command
-    has_block = any(i["level"] == "block" for i in issues)
-
-    for issue in issues:
-        print(f"{issue['message']}", file=sys.stderr)
+    sys.stderr.write("\n".join(issue["message"] for issue in issues) + "\n")
 
+    # If any issue is a block, block the command
     if has_block:
         sys.exit(2)  # Block the command
     else:
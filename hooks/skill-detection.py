@@ -29,30 +29,103 @@ import sys
 from pathlib import Path
 
 
+# Trigger patterns made of plain literals joined by ".*" yield required characters
+_PLAIN_PIECE = re.compile(r"[A-Za-z0-9 _-]*")
+
+
 def load_skill_rules() -> dict:
     """Load skill-rules.json from ~/.claude/skills/"""
     rules_path = Path.home() / ".claude" / "skills" / "skill-rules.json"
     try:
-        return json.loads(rules_path.read_text())
+        rules = json.loads(rules_path.read_text())
+        prepare_rules(rules)
     except Exception as e:
         print(f"Error loading skill rules: {e}", file=sys.stderr)
         sys.exit(1)
+    return rules
 
 
-def check_match(prompt: str, skill_triggers: dict) -> bool:
-    """Check if prompt matches skill triggers (keywords or patterns)."""
-    prompt_lower = prompt.lower()
+def prepare_rules(rules: dict):
+    """Precompile trigger patterns and the keyword index onto the rules dict."""
+    skills = rules.get("skills", [])
+    for skill in skills:
+        triggers = skill.setdefault("triggers", {})
+        triggers["_compiled_patterns"] = [
+            (pattern_mask(p), compile_pattern(p)) for p in triggers.get("patterns", [])
+        ]
+    rules["_keyword_index"] = build_keyword_index(skills)
 
-    # Check keywords
-    keywords = skill_triggers.get("keywords", [])
-    for kw in keywords:
-        if kw.lower() in prompt_lower:
-            return True
 
-    # Check patterns (regex)
-    patterns = skill_triggers.get("patterns", [])
-    for pattern in patterns:
-        if re.search(pattern, prompt_lower, re.IGNORECASE):
+def char_mask(text: str) -> int:
+    """Fold the characters of text into a 64-bit presence mask."""
+    mask = 0
+    for c in set(text):
+        mask |= 1 << (ord(c) & 63)
+    return mask
+
+
+def is_plain_pattern(pattern: str) -> bool:
+    """True if pattern is only plain literals joined by ".*"."""
+    return all(_PLAIN_PIECE.fullmatch(piece) for piece in pattern.split(".*"))
+
+
+def pattern_mask(pattern: str) -> int:
+    """Mask of characters every match of pattern must contain (0 if unknown)."""
+    if not is_plain_pattern(pattern):
+        return 0
+    return char_mask(pattern.replace(".*", "").lower())
+
+
+def compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a trigger pattern for matching against the lowercased prompt.
+
+    Plain patterns are lowercased up front so the engine can match
+    case-sensitively; anything else keeps re.IGNORECASE, since lowercasing
+    arbitrary regex syntax would change escapes like \\S or \\W.
+    """
+    if is_plain_pattern(pattern):
+        return re.compile(pattern.lower())
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def build_keyword_index(skills: list[dict]) -> tuple:
+    """Build one regex over all skill keywords. Returns (pattern, keyword -> skill names).
+
+    Keywords sit longest-first inside a lookahead, so every position reports
+    the longest keyword starting there; shorter keywords at that position are
+    its prefixes and share its skills, preserving plain substring semantics.
+    """
+    owners = {}
+    for skill in skills:
+        for kw in skill.get("triggers", {}).get("keywords", []):
+            owners.setdefault(kw.lower(), set()).add(skill.get("name", ""))
+
+    if not owners:
+        return None, {}
+
+    keywords = sorted(owners, key=len, reverse=True)
+    skills_for = {}
+    for kw in keywords:
+        names = set()
+        for other in keywords:
+            if kw.startswith(other):
+                names |= owners[other]
+        skills_for[kw] = names
+
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+    return pattern, skills_for
+
+
+def check_match(prompt_lower: str, skill_triggers: dict, prompt_mask: int = -1) -> bool:
+    """Check if lowercased prompt matches skill trigger patterns (regex).
+
+    Patterns whose required characters are missing from prompt_mask are
+    skipped without running the regex engine.
+    """
+    for mask, pattern in skill_triggers.get("_compiled_patterns", []):
+        if mask & prompt_mask != mask:
+            continue
+        if pattern.search(prompt_lower):
             return True
 
     return False
@@ -70,13 +143,23 @@ def main():
         sys.exit(0)
 
     rules = load_skill_rules()
+    skills = rules.get("skills", [])
+    prompt_lower = prompt.lower()
+    prompt_mask = char_mask(prompt_lower)
     matched_skills = []
 
-    for skill in rules.get("skills", []):
+    # Single pass over the prompt for every keyword of every skill
+    keyword_re, skills_for = rules["_keyword_index"]
+    keyword_hits = set()
+    if keyword_re:
+        for m in keyword_re.finditer(prompt_lower):
+            keyword_hits |= skills_for[m.group(1)]
+
+    for skill in skills:
         skill_name = skill.get("name", "")
         triggers = skill.get("triggers", {})
 
-        if check_match(prompt, triggers):
+        if skill_name in keyword_hits or check_match(prompt_lower, triggers, prompt_mask):
             matched_skills.append(skill_name)
 
     if matched_skills:
@@ -86,7 +169,7 @@ def main():
             f"- {', '.join(matched_skills)}\n"
             f"Use `/skill {skill_hint}` to load a specific skill if you need it.\n"
         )
-        print(suggestion, file=sys.stderr)
+        sys.stderr.write(suggestion + "\n")
 
     sys.exit(0)
 
@@ -1,33 +1,33 @@
 #!/usr/bin/env python3
 """
-Add a source to an existing NotebookLM notebook.
-Supports text content, files, and URLs.
+Add sources to an existing NotebookLM notebook.
+Supports text content, files, and URLs (repeat --content-file/--source-url to add several).
 Uses notebooklm-py async API.
 """
 
 import argparse
 import asyncio
+import os
 import sys
 import tempfile
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from auth_manager import AuthManager
-from config import resolve_notebook_id
 
-
-async def add_source_to_notebook(
+async def _add_one_source(
+    client,
     notebook_id: str,
     content: str | None = None,
     content_file: str | None = None,
     source_url: str | None = None,
     source_name: str = "",
-) -> dict:
+):
     """
-    Add a source to an existing NotebookLM notebook.
+    Add a single source using an open NotebookLM client.
 
     Args:
+        client: Open NotebookLMClient
         notebook_id: NotebookLM notebook API ID
         content: Text content to add as source
         content_file: Path to file to add as source
@@ -35,62 +35,161 @@ async def add_source_to_notebook(
         source_name: Display name for the source
 
     Returns:
-        dict with status
+        The created source
     """
+    rename_to = source_name
+
+    if source_url:
+        # Add URL source
+        print(f"  Adding URL source: {source_url}")
+        source = await client.sources.add_url(notebook_id, source_url, wait=True)
+        print(f"  URL source added (ID: {source.id if hasattr(source, 'id') else 'ok'})")
+
+    elif content_file:
+        # Add file source
+        file_path = Path(content_file)
+        print(f"  Adding file source: {file_path.name} ({file_path.stat().st_size} bytes)")
+        source = await client.sources.add_file(notebook_id, str(file_path), wait=True)
+        print(f"  File source added (ID: {source.id if hasattr(source, 'id') else 'ok'})")
+
+    elif content and hasattr(client.sources, "add_text"):
+        # Upload text directly; the title is set here, so no rename needed
+        print(f"  Adding text source ({len(content)} chars)...")
+        title = source_name or "Text source"
+        source = await client.sources.add_text(notebook_id, title, content, wait=True)
+        rename_to = ""
+        print(f"  Text source added (ID: {source.id if hasattr(source, 'id') else 'ok'})")
+
+    else:
+        # Older clients only take files: write text to temp file and add
+        print(f"  Adding text source ({len(content)} chars)...")
+        suffix = ".md" if (content.startswith("#") or content.find("##", 0, 200) != -1) else ".txt"
+        prefix = f"{source_name[:20]}_" if source_name else "source_"
+
+        with tempfile.NamedTemporaryFile(
+            mode="wb", suffix=suffix, prefix=prefix, delete=False
+        ) as tmp:
+            tmp.write(content.encode("utf-8"))
+            tmp_path = tmp.name
+
+        try:
+            source = await client.sources.add_file(notebook_id, tmp_path, wait=True)
+            print(f"  Text source added (ID: {source.id if hasattr(source, 'id') else 'ok'})")
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
+
+    # Rename source if name provided
+    if rename_to and hasattr(source, "id"):
+        try:
+            await client.sources.rename(notebook_id, source.id, rename_to)
+            print(f"  Renamed source to: {rename_to}")
+        except Exception:
+            pass  # rename is optional
+
+    return source
+
+
+def _plan_sources(
+    content: str | None = None,
+    content_file: str | list[str] | None = None,
+    source_url: str | list[str] | None = None,
+    source_name: str = "",
+) -> tuple[list[dict], str | None]:
+    """
+    Decide which sources to add.
+
+    A single --source-url/--content-file keeps the original precedence
+    (URL, then text content, then file) and adds one source. Only when
+    --source-url or --content-file is repeated are all given URLs and
+    files added, and then --content and --source-name are rejected.
+
+    Returns:
+        (list of _add_one_source kwargs, error message or None)
+    """
+    urls = [source_url] if isinstance(source_url, str) else source_url or []
+    files = [content_file] if isinstance(content_file, str) else content_file or []
+
+    if len(urls) > 1 or len(files) > 1:
+        if content:
+            return [], "--content cannot be combined with repeated --source-url/--content-file"
+        if source_name:
+            return [], "--source-name applies to a single source; omit it when adding several"
+        jobs = [{"source_url": url} for url in urls]
+        jobs += [{"content_file": path} for path in files]
+        return jobs, None
+
+    if urls:
+        return [{"source_url": urls[0], "source_name": source_name}], None
+    if content:
+        return [{"content": content, "source_name": source_name}], None
+    if files:
+        return [{"content_file": files[0], "source_name": source_name}], None
+    return [], "No source content provided"
+
+
+async def add_source_to_notebook(
+    notebook_id: str,
+    content: str | None = None,
+    content_file: str | list[str] | None = None,
+    source_url: str | list[str] | None = None,
+    source_name: str = "",
+) -> dict:
+    """
+    Add one or more sources to an existing NotebookLM notebook.
+
+    See _plan_sources for how the arguments map to sources. All sources
+    share one client session and are uploaded concurrently.
+
+    Args:
+        notebook_id: NotebookLM notebook API ID
+        content: Text content to add as source
+        content_file: Path, or list of paths, of files to add as sources
+        source_url: URL, or list of URLs, to add as sources
+        source_name: Display name for the source (single source only)
+
+    Returns:
+        dict with status, source_id (first added), source_ids, and per-source errors
+    """
+    jobs, error = _plan_sources(content, content_file, source_url, source_name)
+    if error:
+        return {"status": "error", "error": error}
+
     try:
         from notebooklm import NotebookLMClient
 
         async with await NotebookLMClient.from_storage() as client:
-            if source_url:
-                # Add URL source
-                print(f"  Adding URL source: {source_url}")
-                source = await client.sources.add_url(notebook_id, source_url, wait=True)
-                print(f"  URL source added (ID: {source.id if hasattr(source, 'id') else 'ok'})")
-
-            elif content_file and Path(content_file).exists():
-                # Add file source
-                file_path = Path(content_file)
-                print(f"  Adding file source: {file_path.name} ({file_path.stat().st_size} bytes)")
-                source = await client.sources.add_file(notebook_id, str(file_path), wait=True)
-                print(f"  File source added (ID: {source.id if hasattr(source, 'id') else 'ok'})")
-
-            elif content:
-                # Write text to temp file and add
-                print(f"  Adding text source ({len(content)} chars)...")
-                suffix = ".md" if (content.startswith("#") or "##" in content[:200]) else ".txt"
-                prefix = f"{source_name[:20]}_" if source_name else "source_"
-
-                with tempfile.NamedTemporaryFile(
-                    mode="w", suffix=suffix, prefix=prefix,
-                    delete=False, encoding="utf-8"
-                ) as tmp:
-                    tmp.write(content)
-                    tmp_path = tmp.name
-
-                try:
-                    source = await client.sources.add_file(notebook_id, tmp_path, wait=True)
-                    print(f"  Text source added (ID: {source.id if hasattr(source, 'id') else 'ok'})")
-                finally:
-                    Path(tmp_path).unlink(missing_ok=True)
-            else:
-                return {"status": "error", "error": "No source content provided"}
-
-            # Rename source if name provided
-            if source_name and hasattr(source, "id"):
-                try:
-                    await client.sources.rename(notebook_id, source.id, source_name)
-                    print(f"  Renamed source to: {source_name}")
-                except Exception:
-                    pass  # rename is optional
-
-            return {"status": "success", "source_id": getattr(source, "id", None)}
+            results = await asyncio.gather(
+                *(_add_one_source(client, notebook_id, **job) for job in jobs),
+                return_exceptions=True,
+            )
 
     except Exception as e:
         print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.environ.get("NOTEBOOKLM_DEBUG"):
+            import traceback
+            traceback.print_exc()
         return {"status": "error", "error": str(e)}
 
+    source_ids = []
+    errors = []
+    for result in results:
+        if isinstance(result, BaseException):
+            print(f"  Failed to add source: {result}")
+            errors.append(str(result))
+        else:
+            source_ids.append(getattr(result, "id", None))
+
+    if not source_ids:
+        return {"status": "error", "error": "; ".join(errors)}
+
+    status = "partial" if errors else "success"
+    return {
+        "status": status,
+        "source_id": source_ids[0],
+        "source_ids": source_ids,
+        "errors": errors,
+    }
+
 
 def main():
     parser = argparse.ArgumentParser(description="Add source to NotebookLM notebook")
@@ -98,30 +197,42 @@ def main():
     parser.add_argument("--notebook-url", help="NotebookLM notebook URL")
     parser.add_argument("--notebook-id", help="Notebook ID from local library")
     parser.add_argument("--content", help="Text content to add")
-    parser.add_argument("--content-file", help="Path to file to add as source")
-    parser.add_argument("--source-url", help="URL to add as source")
-    parser.add_argument("--source-name", default="", help="Display name for the source")
+    parser.add_argument("--content-file", action="append",
+                        help="Path to file to add as source (repeat to add several files)")
+    parser.add_argument("--source-url", action="append",
+                        help="URL to add as source (repeat to add several URLs)")
+    parser.add_argument("--source-name", default="",
+                        help="Display name for the source (not allowed when adding several)")
     args = parser.parse_args()
 
+    if not args.content and not args.source_url and not args.content_file:
+        print("No content provided. Use --content, --content-file, or --source-url")
+        sys.exit(1)
+
+    _, error = _plan_sources(args.content, args.content_file, args.source_url, args.source_name)
+    if error:
+        print(error)
+        sys.exit(1)
+
+    # Deferred so --help and argument errors skip the skill imports
+    from auth_manager import AuthManager
+    from config import resolve_notebook_id
+
     # Check auth
     auth = AuthManager()
     if not auth.is_authenticated():
         print("Not authenticated. Run: python scripts/run.py auth_manager.py setup")
         sys.exit(1)
 
-    # Resolve content
-    content = args.content
-    if args.content_file and not content:
-        file_path = Path(args.content_file)
-        if not file_path.exists():
-            print(f"File not found: {args.content_file}")
+    # Check content files (they are uploaded by path, not read into memory).
+    # As before, a single --content-file is ignored when --content is given.
+    content_files = args.content_file or []
+    if args.content and len(content_files) == 1:
+        content_files = []
+    for content_file in content_files:
+        if not Path(content_file).exists():
+            print(f"File not found: {content_file}")
             sys.exit(1)
-        content = file_path.read_text(encoding="utf-8")
-        print(f"Read {len(content)} chars from {args.content_file}")
-
-    if not content and not args.source_url and not args.content_file:
-        print("No content provided. Use --content, --content-file, or --source-url")
-        sys.exit(1)
 
     # Resolve notebook
     notebook_id = resolve_notebook_id(args)
@@ -132,14 +243,19 @@ def main():
 
     result = asyncio.run(add_source_to_notebook(
         notebook_id=notebook_id,
-        content=content,
-        content_file=args.content_file if not content else None,
+        content=args.content,
+        content_file=args.content_file,
         source_url=args.source_url,
         source_name=args.source_name,
     ))
 
     if result["status"] == "success":
-        print(f"\nSource added successfully!")
+        count = len(result["source_ids"])
+        print(f"\nSource added successfully!" if count == 1 else f"\n{count} sources added successfully!")
+    elif result["status"] == "partial":
+        failed = len(result["errors"])
+        print(f"\nAdded {len(result['source_ids'])} sources, {failed} failed")
+        sys.exit(1)
     else:
         print(f"\nFailed: {result.get('error')}")
         sys.exit(1)
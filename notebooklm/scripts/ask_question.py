@@ -6,14 +6,12 @@ Uses notebooklm-py async API for querying notebooks.
 
 import argparse
 import asyncio
+import os
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from auth_manager import AuthManager
-from config import resolve_notebook_id
-
 async def ask_notebooklm(question: str, notebook_id: str, source_ids: list[str] | None = None) -> str | None:
     """
     Ask a question to a NotebookLM notebook.
@@ -52,8 +50,9 @@ async def ask_notebooklm(question: str, notebook_id: str, source_ids: list[str]
 
     except Exception as e:
         print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.environ.get("NOTEBOOKLM_DEBUG"):
+            import traceback
+            traceback.print_exc()
         return None
 
 
@@ -66,6 +65,10 @@ def main():
     parser.add_argument("--source-ids", help="Comma-separated source IDs to target")
     args = parser.parse_args()
 
+    # Deferred so --help and argument errors skip the skill imports
+    from auth_manager import AuthManager
+    from config import resolve_notebook_id
+
     # Check auth
     auth = AuthManager()
     if not auth.is_authenticated():
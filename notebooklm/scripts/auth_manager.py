@@ -10,6 +10,7 @@ import asyncio
 import json
 import os
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -18,11 +19,23 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from config import AUTH_INFO_FILE, DATA_DIR, NOTEBOOKLM_HOME, STORAGE_STATE_FILE
 
+# Prefer orjson for the cookie/auth JSON when installed; json.loads also takes bytes
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Browser profile for persistent login (same as notebooklm-py)
 BROWSER_PROFILE = NOTEBOOKLM_HOME / "browser_profile"
 NOTEBOOKLM_URL = "https://notebooklm.google.com/"
 
 
+def _is_notebooklm_home(url: str) -> bool:
+    """True when on NotebookLM itself rather than a Google auth redirect."""
+    return "notebooklm.google.com" in url and "accounts.google.com" not in url
+
+
 class AuthManager:
     """Manages authentication for NotebookLM via Playwright + notebooklm-py."""
 
@@ -31,33 +44,36 @@ class AuthManager:
 
     def is_authenticated(self) -> bool:
         """Check if valid authentication exists."""
-        if not STORAGE_STATE_FILE.exists():
-            return False
+        # One open + fstat serves the existence and age checks
+        try:
+            with open(STORAGE_STATE_FILE, "rb") as f:
+                st = os.fstat(f.fileno())
+
+                age_days = (datetime.now().timestamp() - st.st_mtime) / 86400
+                if age_days > 7:
+                    print("  Auth cookies may be expired (>7 days old)")
+                    return False
 
-        mtime = os.path.getmtime(STORAGE_STATE_FILE)
-        age_days = (datetime.now().timestamp() - mtime) / 86400
-        if age_days > 7:
-            print("  Auth cookies may be expired (>7 days old)")
+                blob = f.read()
+        except OSError:
             return False
 
         try:
-            data = json.loads(STORAGE_STATE_FILE.read_text())
-            cookies = data.get("cookies", [])
-            if not cookies:
-                return False
-            return True
+            data = _loads(blob)
+            return bool(data.get("cookies", []))
         except Exception:
             return False
 
     def check_auth(self, test: bool = False) -> dict:
         """Check authentication status, optionally test with API call."""
+        storage_exists = STORAGE_STATE_FILE.exists()
         info = {
             "authenticated": False,
             "storage_state": str(STORAGE_STATE_FILE),
-            "storage_exists": STORAGE_STATE_FILE.exists(),
+            "storage_exists": storage_exists,
         }
 
-        if not STORAGE_STATE_FILE.exists():
+        if not storage_exists:
             info["error"] = "No storage_state.json found. Run: python scripts/run.py auth_manager.py setup"
             return info
 
@@ -99,6 +115,7 @@ class AuthManager:
         print("Login will be detected automatically - no need to press Enter.\n")
 
         try:
+            from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
             from playwright.sync_api import sync_playwright
         except ImportError:
             print("Playwright not installed. Run: pip install 'notebooklm-py[browser]'")
@@ -129,38 +146,46 @@ class AuthManager:
                 print("Waiting for login completion...")
                 print("(Will auto-detect when you reach NotebookLM homepage)\n")
 
-                # Poll until user is logged in (URL stays on notebooklm.google.com
+                # Wait until user is logged in (URL stays on notebooklm.google.com
                 # and is NOT redirected to accounts.google.com)
                 max_wait = 600  # 10 minutes
-                poll_interval = 2  # seconds
-                elapsed = 0
+                deadline = time.monotonic() + max_wait
                 logged_in = False
 
-                while elapsed < max_wait:
-                    time.sleep(poll_interval)
-                    elapsed += poll_interval
+                # Progress messages come from a side thread; the wait itself
+                # is driven by Playwright navigation events, not polling
+                done = threading.Event()
 
-                    try:
-                        current_url = page.url
-                    except Exception:
-                        # Browser may have been closed by user
-                        print("Browser was closed.")
-                        break
-
-                    # Check if on NotebookLM (not auth redirect)
-                    if "notebooklm.google.com" in current_url and "accounts.google.com" not in current_url:
-                        # Double-check: wait a moment and verify we're still there
-                        time.sleep(2)
-                        try:
-                            final_url = page.url
-                        except Exception:
-                            break
-                        if "notebooklm.google.com" in final_url and "accounts.google.com" not in final_url:
-                            logged_in = True
+                def report_progress():
+                    elapsed = 0
+                    while not done.wait(30):
+                        elapsed += 30
+                        print(f"  Still waiting... ({elapsed}s elapsed)")
+
+                threading.Thread(target=report_progress, daemon=True).start()
+
+                try:
+                    while not logged_in:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
                             break
+                        page.wait_for_url(_is_notebooklm_home, timeout=remaining * 1000)
 
-                    if elapsed % 30 == 0:
-                        print(f"  Still waiting... ({elapsed}s elapsed)")
+                        # Double-check: wait_for_url already waited for "load", so let
+                        # network activity settle (a late redirect back to
+                        # accounts.google.com shows up here), then verify we're still there
+                        try:
+                            page.wait_for_load_state("networkidle", timeout=3000)
+                        except PlaywrightTimeoutError:
+                            pass
+                        logged_in = _is_notebooklm_home(page.url)
+                except PlaywrightTimeoutError:
+                    pass
+                except Exception:
+                    # Browser may have been closed by user
+                    print("Browser was closed.")
+                finally:
+                    done.set()
 
                 if not logged_in:
                     print("\nLogin not detected (timed out or browser closed).")
@@ -215,7 +240,7 @@ class AuthManager:
         """Get authentication status information."""
         if AUTH_INFO_FILE.exists():
             try:
-                return json.loads(AUTH_INFO_FILE.read_text())
+                return _loads(AUTH_INFO_FILE.read_bytes())
             except Exception:
                 pass
         return {"authenticated_at": None, "method": "unknown"}
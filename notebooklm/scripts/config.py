@@ -4,9 +4,12 @@ Centralizes constants and paths.
 Uses notebooklm-py package for API access.
 """
 
+import functools
 import re
 from pathlib import Path
 
+from notebook_manager import NotebookLibrary
+
 # Paths
 SKILL_DIR = Path(__file__).parent.parent
 DATA_DIR = SKILL_DIR / "data"
@@ -21,13 +24,17 @@ STORAGE_STATE_FILE = NOTEBOOKLM_HOME / "storage_state.json"
 QUERY_TIMEOUT = 120
 SOURCE_WAIT_TIMEOUT = 300
 
+_NB_ID_RE = re.compile(r"/notebook/([a-zA-Z0-9_-]+)")
+_SLUG_TABLE = str.maketrans({" ": "-", "_": "-"})
+
 
+@functools.lru_cache(maxsize=256)
 def extract_notebook_id(url: str) -> str | None:
     """Extract notebook ID from a NotebookLM URL.
 
     URL format: https://notebooklm.google.com/notebook/{id}
     """
-    match = re.search(r"/notebook/([a-zA-Z0-9_-]+)", url)
+    match = _NB_ID_RE.search(url)
     return match.group(1) if match else None
 
 
@@ -38,7 +45,7 @@ def notebook_url_from_id(notebook_id: str) -> str:
 
 def generate_slug(name: str) -> str:
     """Generate a URL-safe slug from a name."""
-    return name.lower().replace(" ", "-").replace("_", "-")
+    return name.lower().translate(_SLUG_TABLE)
 
 
 def resolve_notebook_id(args) -> str | None:
@@ -46,8 +53,6 @@ def resolve_notebook_id(args) -> str | None:
 
     Expects args to have optional notebook_url and notebook_id attributes.
     """
-    from notebook_manager import NotebookLibrary
-
     # Direct notebook URL
     if getattr(args, "notebook_url", None):
         nid = extract_notebook_id(args.notebook_url)
@@ -56,9 +61,12 @@ def resolve_notebook_id(args) -> str | None:
         print(f"Could not extract notebook ID from URL: {args.notebook_url}")
         return None
 
+    # Library lookups share one instance per call. It is not cached across
+    # calls, since other code (e.g. create_notebook) may update library.json.
+    library = NotebookLibrary()
+
     # Library notebook ID
     if getattr(args, "notebook_id", None):
-        library = NotebookLibrary()
         notebook = library.get_notebook(args.notebook_id)
         if notebook:
             return notebook.get("notebooklm_id") or extract_notebook_id(notebook["url"])
@@ -66,7 +74,6 @@ def resolve_notebook_id(args) -> str | None:
         return None
 
     # Active notebook
-    library = NotebookLibrary()
     active = library.get_active_notebook()
     if active:
         print(f"Using active notebook: {active['name']}")
@@ -4,17 +4,15 @@ Create a new NotebookLM notebook and optionally add text/file as a source.
 Uses notebooklm-py async API.
 """
 
-import argparse
-import asyncio
+import os
 import sys
-import tempfile
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from auth_manager import AuthManager
 from notebook_manager import NotebookLibrary
-from config import notebook_url_from_id
+from config import generate_slug, notebook_url_from_id
 
 
 async def create_notebook(
@@ -44,14 +42,19 @@ async def create_notebook(
         print("Not authenticated. Run: python scripts/run.py auth_manager.py setup")
         return {"status": "error", "error": "Not authenticated"}
 
-    # Resolve content
-    if content_file and not content:
-        file_path = Path(content_file)
-        if not file_path.exists():
-            print(f"File not found: {content_file}")
-            return {"status": "error", "error": f"File not found: {content_file}"}
-        content = file_path.read_text(encoding="utf-8")
-        print(f"Read {len(content)} chars from {content_file}")
+    # Resolve content (files are uploaded by path, not read into memory).
+    # cf_path is None unless the file exists, so later branches skip re-checking.
+    cf_path = Path(content_file) if content_file else None
+    if cf_path is not None:
+        try:
+            size = cf_path.stat().st_size
+        except OSError:
+            if not content:
+                print(f"File not found: {content_file}")
+                return {"status": "error", "error": f"File not found: {content_file}"}
+            cf_path = None  # fall back to the text content
+        else:
+            print(f"Using {size} bytes from {content_file}")
 
     print(f"Creating notebook: {name}")
 
@@ -76,26 +79,27 @@ async def create_notebook(
                 source_added = True
                 print("  URL source added")
 
-            elif content_file and Path(content_file).exists():
+            elif cf_path is not None:
                 # Add file source directly
                 print(f"  Adding file source: {content_file}")
-                await client.sources.add_file(notebook_id, content_file, wait=True)
+                await client.sources.add_file(notebook_id, str(cf_path), wait=True)
                 source_added = True
                 print("  File source added")
 
             elif content:
                 # Write text content to temp file and add as source
+                import tempfile
+
                 print(f"  Adding text source ({len(content)} chars)...")
                 suffix = ".txt"
                 # Use .md if content looks like markdown
-                if content.startswith("#") or "##" in content[:200]:
+                if content.startswith("#") or content.find("##", 0, 200) != -1:
                     suffix = ".md"
 
                 with tempfile.NamedTemporaryFile(
-                    mode="w", suffix=suffix, prefix=f"{name[:20]}_",
-                    delete=False, encoding="utf-8"
+                    mode="wb", suffix=suffix, prefix=f"{name[:20]}_", delete=False
                 ) as tmp:
-                    tmp.write(content)
+                    tmp.write(content.encode("utf-8"))
                     tmp_path = tmp.name
 
                 try:
@@ -116,7 +120,7 @@ async def create_notebook(
                     topics=topic_list,
                     notebooklm_id=notebook_id,
                 )
-                library.select_notebook(name.lower().replace(" ", "-").replace("_", "-"))
+                library.select_notebook(generate_slug(name))
                 print("  Registered in local library and set as active")
             except Exception as e:
                 print(f"  Could not register in library: {e}")
@@ -139,12 +143,16 @@ async def create_notebook(
 
     except Exception as e:
         print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.environ.get("NOTEBOOKLM_DEBUG"):
+            import traceback
+            traceback.print_exc()
         return {"status": "error", "error": str(e)}
 
 
 def main():
+    import argparse
+    import asyncio
+
     parser = argparse.ArgumentParser(description="Create a new NotebookLM notebook")
 
     parser.add_argument("--name", required=True, help="Name for the notebook")
@@ -35,8 +35,8 @@ class NotebookLibrary:
         """Load library from disk"""
         if self.library_file.exists():
             try:
-                with open(self.library_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.library_file, 'rb') as f:
+                    data = json.loads(f.read())
                     self.notebooks = data.get('notebooks', {})
                     self.active_notebook_id = data.get('active_notebook_id')
                     print(f"📚 Loaded library with {len(self.notebooks)} notebooks")
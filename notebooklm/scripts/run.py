@@ -6,19 +6,65 @@ Works on both Claude Code and OpenClaw (handles Homebrew Python on macOS).
 """
 
 import os
+import re
+import shutil
 import sys
 import subprocess
 from pathlib import Path
+from typing import Optional
 
 # Minimum Python version required by notebooklm-py
 MIN_PYTHON = (3, 11)
 
+# Interpreter found by the fixed-path probe, reused on later setups
+PYTHON_PATH_FILE = Path(__file__).parent.parent / "data" / ".python-path"
+
 
 def find_suitable_python() -> str:
     """Find a Python >= 3.11 executable. Checks Homebrew paths on macOS."""
     if sys.version_info >= MIN_PYTHON:
         return sys.executable
 
+    # Versioned names on PATH may be pyenv shims for an inactive version
+    for name in ("python3.14", "python3.13", "python3.12", "python3.11"):
+        path = shutil.which(name)
+        if path and _is_suitable_python(path):
+            return path
+
+    # The remembered path may since have been replaced by an older Python
+    try:
+        cached = PYTHON_PATH_FILE.read_text().strip()
+        if cached and os.access(cached, os.X_OK) and _is_suitable_python(cached):
+            return cached
+    except OSError:
+        pass
+
+    python = _probe_candidates()
+    if not python:
+        return sys.executable  # fallback
+
+    try:
+        PYTHON_PATH_FILE.parent.mkdir(parents=True, exist_ok=True)
+        PYTHON_PATH_FILE.write_text(python)
+    except OSError:
+        pass
+    return python
+
+
+def _is_suitable_python(path: str) -> bool:
+    """Check an interpreter's version from "--version" (no user code runs, unlike "-c")."""
+    try:
+        result = subprocess.run(
+            [path, "--version"], capture_output=True, text=True, timeout=5,
+        )
+    except Exception:
+        return False
+    match = re.match(r"Python (\d+)\.(\d+)", result.stdout or result.stderr)
+    return bool(match) and (int(match[1]), int(match[2])) >= MIN_PYTHON
+
+
+def _probe_candidates() -> Optional[str]:
+    """Check the common install locations for a suitable interpreter."""
     # Common locations for newer Python (macOS Homebrew, Linux)
     candidates = [
         "/opt/homebrew/bin/python3",
@@ -32,18 +78,10 @@ def find_suitable_python() -> str:
         "/usr/local/bin/python3.11",
     ]
     for path in candidates:
-        if Path(path).exists():
-            try:
-                result = subprocess.run(
-                    [path, "-c", "import sys; print(sys.version_info >= (3, 11))"],
-                    capture_output=True, text=True, timeout=5,
-                )
-                if result.stdout.strip() == "True":
-                    return path
-            except Exception:
-                continue
-
-    return sys.executable  # fallback
+        if Path(path).exists() and _is_suitable_python(path):
+            return path
+
+    return None
 
 
 def get_venv_python():
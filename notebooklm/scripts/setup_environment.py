@@ -5,6 +5,7 @@ Manages virtual environment and dependencies automatically.
 Uses notebooklm-py package for API access, Playwright for login.
 """
 
+import hashlib
 import os
 import sys
 import subprocess
@@ -19,6 +20,8 @@ class SkillEnvironment:
         self.skill_dir = Path(__file__).parent.parent
         self.venv_dir = self.skill_dir / ".venv"
         self.requirements_file = self.skill_dir / "requirements.txt"
+        # Hash of the requirements.txt last installed successfully into the venv
+        self.req_hash_file = self.venv_dir / ".req-hash"
 
         if os.name == 'nt':
             self.venv_python = self.venv_dir / "Scripts" / "python.exe"
@@ -43,39 +46,89 @@ class SkillEnvironment:
                 return False
 
         if self.requirements_file.exists():
+            req_hash = hashlib.blake2b(
+                self.requirements_file.read_bytes(), digest_size=16
+            ).hexdigest()
+            try:
+                if self.req_hash_file.read_text().strip() == req_hash:
+                    print("Dependencies up to date")
+                    return True
+            except OSError:
+                pass
+
             print("Installing dependencies...")
+            pip = [str(self.venv_pip), "install", "--quiet", "--disable-pip-version-check", "--no-input"]
+            chromium = None
             try:
                 subprocess.run(
-                    [str(self.venv_pip), "install", "--upgrade", "pip"],
-                    check=True, capture_output=True, text=True
+                    pip + ["--upgrade", "pip"],
+                    check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
                 )
 
-                result = subprocess.run(
-                    [str(self.venv_pip), "install", "-r", str(self.requirements_file)],
-                    check=True, capture_output=True, text=True
+                # Install Playwright first so the Chromium download (needed for
+                # notebooklm login) overlaps with the remaining requirements
+                subprocess.run(
+                    pip + ["playwright"],
+                    check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
                 )
-                print("Dependencies installed")
+                playwright_before = self._playwright_dist()
+                print("Installing Chromium for Playwright (in background)...")
+                chromium = self._start_chromium_install()
 
-                # Install Chromium for Playwright (needed for notebooklm login)
-                print("Installing Chromium for Playwright...")
-                try:
-                    subprocess.run(
-                        [str(self.venv_python), "-m", "playwright", "install", "chromium"],
-                        check=True, capture_output=True, text=True
-                    )
-                    print("Chromium installed")
-                except subprocess.CalledProcessError as e:
-                    print(f"Warning: Failed to install Chromium: {e}")
-                    print("  You may need to run: python -m playwright install chromium")
-
-                return True
+                subprocess.run(
+                    pip + ["-r", str(self.requirements_file)],
+                    check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+                )
+                print("Dependencies installed")
             except subprocess.CalledProcessError as e:
                 print(f"Failed to install dependencies: {e}")
+                if e.stderr:
+                    print(e.stderr.strip())
+                if chromium:
+                    chromium.kill()
+                    chromium.wait()
                 return False
+
+            chromium_ok = self._finish_chromium_install(chromium)
+
+            # Requirements may pin a different Playwright, whose browser
+            # revision differs from the one just downloaded
+            if chromium_ok and self._playwright_dist() != playwright_before:
+                print("Playwright version changed, reinstalling Chromium...")
+                chromium_ok = self._finish_chromium_install(self._start_chromium_install())
+
+            if chromium_ok:
+                print("Chromium installed")
+                self.req_hash_file.write_text(req_hash)
+            else:
+                print("  You may need to run: python -m playwright install chromium")
+
+            return True
         else:
             print("No requirements.txt found")
             return True
 
+    def _start_chromium_install(self) -> subprocess.Popen:
+        """Start the Playwright Chromium download without waiting for it"""
+        return subprocess.Popen(
+            [str(self.venv_python), "-m", "playwright", "install", "chromium"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
+
+    def _finish_chromium_install(self, proc: subprocess.Popen) -> bool:
+        """Wait for a Chromium download started by _start_chromium_install"""
+        _, stderr = proc.communicate()
+        if proc.returncode != 0:
+            print(f"Warning: Failed to install Chromium: {stderr.strip() or proc.returncode}")
+            return False
+        return True
+
+    def _playwright_dist(self) -> list:
+        """Installed Playwright dist-info directory names in the venv"""
+        patterns = ("lib/python*/site-packages/playwright-*.dist-info",
+                    "Lib/site-packages/playwright-*.dist-info")
+        return sorted(p.name for pattern in patterns for p in self.venv_dir.glob(pattern))
+
     def is_in_skill_venv(self) -> bool:
         """Check if we're already running in the skill's venv"""
         if hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
@@ -11,6 +11,7 @@ Example:
 """
 
 import fnmatch
+import os
 import sys
 import zipfile
 from pathlib import Path
@@ -39,6 +40,25 @@ def should_exclude(rel_path: Path) -> bool:
     return any(fnmatch.fnmatch(name, pat) for pat in EXCLUDE_GLOBS)
 
 
+def iter_files(root):
+    """
+    Recursively yield files under root, files before subdirectories.
+
+    Uses os.scandir so entry types come from the directory listing
+    instead of a stat() per path. Symlinked directories are not followed.
+    """
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+        elif entry.is_file():
+            yield Path(entry.path)
+    for subdir in subdirs:
+        yield from iter_files(subdir)
+
+
 def package_skill(skill_path, output_dir=None):
     """
     Package a skill folder into a .skill file.
@@ -90,9 +110,7 @@ def package_skill(skill_path, output_dir=None):
     try:
         with zipfile.ZipFile(skill_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
             # Walk through the skill directory, excluding build artifacts
-            for file_path in skill_path.rglob('*'):
-                if not file_path.is_file():
-                    continue
+            for file_path in iter_files(skill_path):
                 arcname = file_path.relative_to(skill_path.parent)
                 if should_exclude(arcname):
                     print(f"  Skipped: {arcname}")
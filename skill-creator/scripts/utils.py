@@ -1,29 +1,30 @@
 """Shared utilities for skill-creator scripts."""
 
+import re
 from pathlib import Path
 
+# A frontmatter delimiter line: "---" with optional surrounding whitespace
+_DELIMITER_RE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
 
 
 def parse_skill_md(skill_path: Path) -> tuple[str, str, str]:
     """Parse a SKILL.md file, returning (name, description, full_content)."""
     content = (skill_path / "SKILL.md").read_text()
-    lines = content.split("\n")
 
-    if lines[0].strip() != "---":
+    # Only the frontmatter is split into lines; the body is never scanned
+    first_nl = content.find("\n")
+    first_line = content if first_nl == -1 else content[:first_nl]
+    if first_line.strip() != "---":
         raise ValueError("SKILL.md missing frontmatter (no opening ---)")
 
-    end_idx = None
-    for i, line in enumerate(lines[1:], start=1):
-        if line.strip() == "---":
-            end_idx = i
-            break
-
-    if end_idx is None:
+    closing = None if first_nl == -1 else _DELIMITER_RE.search(content, first_nl + 1)
+    if closing is None:
         raise ValueError("SKILL.md missing frontmatter (no closing ---)")
 
     name = ""
     description = ""
-    frontmatter_lines = lines[1:end_idx]
+    block = content[first_nl + 1:closing.start()]
+    frontmatter_lines = block[:-1].split("\n") if block else []
     i = 0
     while i < len(frontmatter_lines):
         line = frontmatter_lines[i]